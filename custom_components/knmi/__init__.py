@@ -12,8 +12,7 @@ from typing import Any, Callable
 
 # import aiohttp
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (CONF_API_KEY, CONF_LATITUDE, CONF_LONGITUDE,
-                                 Platform)
+from homeassistant.const import CONF_API_KEY, CONF_LATITUDE, CONF_LONGITUDE
 from homeassistant.core import Config, HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
@@ -23,16 +22,9 @@ from homeassistant.helpers.update_coordinator import (DataUpdateCoordinator,
                                                       UpdateFailed)
 
 from .api import KnmiApiClient
-from .const import (_LOGGER, API_CONF_URL, DOMAIN, NAME, PLATFORMS,
-                    SCAN_INTERVAL, VERSION)
+from .const import _LOGGER, API_CONF_URL, DOMAIN, NAME, PLATFORMS, VERSION
 from .coordinator import KnmiDataUpdateCoordinator
 
-PLATFORMS: list[Platform] = [
-    Platform.BINARY_SENSOR,
-    Platform.SENSOR,
-    Platform.WEATHER,
-]
-
 
 async def async_setup(hass: HomeAssistant, config: Config) -> bool:
     """Set up this integration using YAML is not supported."""
@@ -57,7 +49,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.debug("Config entry options are empty")
 
     session = async_get_clientsession(hass)
-    client = KnmiApiClient(api_key, latitude, longitude, session, hass)
+    client = KnmiApiClient(api_key, latitude, longitude, session, hass, entry.entry_id)
 
     device_info = DeviceInfo(
         entry_type=DeviceEntryType.SERVICE,
@@ -72,16 +64,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = coordinator = KnmiDataUpdateCoordinator(
         hass=hass, client=client, device_info=device_info, config_entry=entry,
     )
-    # Fetch the config entry options directly from the entry
-    refresh_interval = entry.options.get("refresh_interval", 300)
-
-    if refresh_interval:
-        _LOGGER.debug("refresh_interval exists 0: %s",refresh_interval)
-        coordinator.refresh_interval = refresh_interval
-
-    _LOGGER.debug("coordinator attributes: %s", dir(coordinator))
     _LOGGER.debug("coordinator attribute refresh_interval: %s", coordinator.refresh_interval)
     _LOGGER.debug("coordinator attribute options: %s", coordinator.options)
+    # The entities read coordinator.data when they are constructed, so the
+    # platforms are only set up once the first refresh has finished
     await coordinator.async_config_entry_first_refresh()
 
     if not coordinator.last_update_success:
@@ -101,5 +87,4 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
\ No newline at end of file
+    await hass.config_entries.async_reload(entry.entry_id)
\ No newline at end of file
@@ -1,12 +1,15 @@
 # api.py
 import asyncio
-import json
+import hashlib
+import logging
+import re
 import socket
-import uuid
+import sys
+from typing import Callable
 
 import aiohttp
 from aiohttp import ClientSession
-import async_timeout
+import orjson
 from homeassistant.components.persistent_notification import \
     async_create as async_create_notification
 from homeassistant.components.persistent_notification import \
@@ -14,8 +17,19 @@ from homeassistant.components.persistent_notification import \
 from homeassistant.core import HomeAssistant
 
 from .const import _LOGGER, API_ENDPOINT, API_TIMEOUT
-from .exceptions import (ApiError, InvalidApiKeyError, KnmiApiException,
-                         RequestsExceededError)
+from .exceptions import (ApiError, InvalidApiKeyError, KNMIError,
+                         KnmiApiException, RequestsExceededError)
+
+# Ask the server to keep the connection in the shared session pool open
+_REQUEST_HEADERS = {"Connection": "keep-alive"}
+
+# Error messages the API returns in the response body
+_ERROR_INVALID_API_KEY = b"Vraag eerst een API-key op"
+_ERROR_DAILY_LIMIT = b"Dagelijkse limiet"
+_ERROR_SERVER = b"De server ondervindt een probleem"
+_ERROR_RE = re.compile(
+    b"|".join(map(re.escape, (_ERROR_INVALID_API_KEY, _ERROR_DAILY_LIMIT, _ERROR_SERVER)))
+)
 
 
 class KnmiApiClient:
@@ -28,38 +42,64 @@ class KnmiApiClient:
         longitude: float,
         session: ClientSession,
         hass: HomeAssistant,
+        entry_id: str | None = None,
     ) -> None:
         self.api_key = api_key
         self.latitude = latitude
         self.longitude = longitude
+        self._url = API_ENDPOINT.format(api_key, latitude, longitude)
         self._session = session
         self.hass = hass
-        self.notification_id = None
+        # Clients without a config entry (config flow validation) derive it from the key
+        notification_key = entry_id or hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        self.notification_id = f"knmi_rate_limit_{notification_key}"
+        # Full JSON payload of the last successful request and its validators,
+        # to recognise an unchanged response
+        self._payload: dict | None = None
+        self._etag: str | None = None
+        self._body_hash: bytes | None = None
 
         _LOGGER.debug("Initialized KnmiApiClient with notification_id: %s", self.notification_id)
 
     async def async_get_data(self) -> dict:
-        """Get data from the KNMI API."""
-        url = API_ENDPOINT.format(self.api_key, self.latitude, self.longitude)
-        return await self._api_wrapper(url)
+        """Get the current weather (liveweer) data from the KNMI API."""
+        data = await self._async_get_payload()
+        if data is None:
+            return None
+        return data["liveweer"][0]  # A list containing a single dictionary element.
+
+    async def _async_get_payload(self) -> dict | None:
+        """Get the full JSON payload from the KNMI API and remember it."""
+        data = await self._api_wrapper(self._url)
+        if data:
+            self._payload = data
+        return data
 
     async def _api_wrapper(self, url: str) -> dict:
-        """Private method to get information from the API."""
+        """Private method to get the validated JSON payload from the API."""
         try:
-            async with async_timeout.timeout(API_TIMEOUT):
-                response = await self._session.get(url)
-                _LOGGER.debug("Response status: %s", response.status)
-                _LOGGER.debug("Response headers: %s", response.headers)
-                #response_json = await response.json()
-                response_text = await response.text()
-                _LOGGER.debug("Response text: %s", response_text)
+            async with asyncio.timeout(API_TIMEOUT):
+                response = await self._session.get(url, headers=self._request_headers())
+                raw = await response.read()
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Response status: %s", response.status)
+                    _LOGGER.debug("Response headers: %s", response.headers)
+                    _LOGGER.debug("Response text: %s", raw.decode(errors="replace"))
+
+                # An unchanged payload doesn't need to be parsed again
+                body_hash = hashlib.blake2b(raw, digest_size=8).digest()
+                if (cached := self._unchanged_payload(response, body_hash)) is not None:
+                    _LOGGER.debug("Payload unchanged, reusing the cached data")
+                    await self._handle_notification_dismissal()
+                    return cached
 
                 # Handle error responses
-                await self._handle_error_responses(response_text)
+                await self._handle_error_responses(raw)
 
                 # Parse JSON response
-                data = await self._parse_json_response(response, response_text)
-                _LOGGER.debug("Raw JSON response: %s", data)
+                data = await self._parse_json_response(response, raw)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Raw JSON response: %s", data)
 
                 if isinstance(data, dict) and "liveweer" in data:
                     _LOGGER.debug("OK! Data is dict and liveweer exist")
@@ -67,19 +107,19 @@ class KnmiApiClient:
                     if liveweer:
                         _LOGGER.debug("OK! Liveweer")
                         await self._handle_notification_dismissal()
-                        return liveweer
+                        self._etag = response.headers.get("ETag")
+                        self._body_hash = body_hash
+                        return data
                     else:
                         raise ApiError("No 'liveweer' data in the response")
                 else:
                     raise ApiError("Invalid data type or structure in JSON response")
-        except asyncio.TimeoutError as exception:
+        except TimeoutError as exception:
             _LOGGER.error(
                 "Timeout error fetching information from %s - %s",
                 url,
                 exception,
             )
-            #raise KnmiApiException("Timeout error")
-            #return
         except (aiohttp.ClientError, socket.gaierror) as exception:
             await self._handle_error_logging(exception, url)
         except RequestsExceededError as exception:
@@ -90,78 +130,67 @@ class KnmiApiClient:
             # Raise to pass on to the user.
             raise exception
 
-    async def _handle_error_responses(self, response_text: str) -> None:
+    def _request_headers(self) -> dict[str, str]:
+        """Return the request headers, conditional if the server sent an ETag."""
+        if self._etag is None or self._payload is None:
+            return _REQUEST_HEADERS
+        return {**_REQUEST_HEADERS, "If-None-Match": self._etag}
+
+    def _unchanged_payload(self, response, body_hash: bytes) -> dict | None:
+        """Return the cached payload if the response didn't change it."""
+        if self._payload is None:
+            return None
+        if response.status == 304 or (
+            response.status == 200 and body_hash == self._body_hash
+        ):
+            return self._payload
+        return None
+
+    async def _handle_error_responses(self, raw: bytes) -> None:
         """Handle error responses from the API."""
-        if "Vraag eerst een API-key op" in response_text:
-            raise InvalidApiKeyError("Invalid API key")
-
-        if "Dagelijkse limiet" in response_text:
-            message = "Het maximum aantal van 300 API verzoeken per dag voor KNMI is bereikt."
-            title = "API limiet bereikt"
-            if not self.notification_exists():
-                self.notification_id = str(uuid.uuid4())
-                async_create_notification(self.hass, message, title, self.notification_id)
-            raise RequestsExceededError("The allowed number of requests has been exceeded")
-
-        if "De server ondervindt een probleem" in response_text:
-            raise KnmiApiException("Error fetching information from the API")
-
-    async def _parse_json_response(self, response, response_text: str) -> dict:
+        if (match := _ERROR_RE.search(raw)) is not None:
+            raise _ERROR_DISPATCH[match.group()](self)
+
+    def _invalid_api_key_error(self) -> KNMIError:
+        """Return the error for an invalid API key."""
+        return InvalidApiKeyError("Invalid API key")
+
+    def _requests_exceeded_error(self) -> KNMIError:
+        """Notify about the daily API limit and return the error for it."""
+        message = "Het maximum aantal van 300 API verzoeken per dag voor KNMI is bereikt."
+        title = "API limiet bereikt"
+        if not self.notification_exists():
+            async_create_notification(self.hass, message, title, self.notification_id)
+        return RequestsExceededError("The allowed number of requests has been exceeded")
+
+    def _server_error(self) -> KNMIError:
+        """Return the error for a server side problem."""
+        return KnmiApiException("Error fetching information from the API")
+
+    async def _parse_json_response(self, response, raw: bytes) -> dict:
         """Parse the JSON response from the API."""
         if response.headers.get("Content-Type") != "application/json":
             raise ApiError("Invalid content type in the response")
 
         try:
-            if response.status == 200 and not "Dagelijkse limiet" in response_text:
-                data = json.loads(response_text)
+            if response.status == 200:
+                data = _intern_keys(orjson.loads(raw))
             else:
                 data = None
-        except json.JSONDecodeError as exception:
+        except orjson.JSONDecodeError as exception:
             _LOGGER.error(
                 "Error decoding JSON response - %s: %s",
                 exception,
-                response_text,
+                raw.decode(errors="replace"),
             )
             raise ApiError("Invalid JSON data in the response")
 
         return data
 
-    async def old_parse_json_response(self, response, response_text: str) -> dict:
-        """Parse the JSON response from the API."""
-        if response.headers.get("Content-Type") != "application/json":
-            raise ApiError("Invalid content type in the response")
-
-        try:
-            if response.status == 200 and not "Dagelijkse limiet" in response_text:
-                data = json.loads(response_text)
-            else:
-                data = None
-        except json.JSONDecodeError as exception:
-            _LOGGER.error(
-                "Error decoding JSON response - %s: %s",
-                exception,
-                response_text,
-            )
-            raise ApiError("Invalid JSON data in the response")
-
-        # Provide default values for missing condition attributes
-        if data and isinstance(data, dict) and "liveweer" in data:
-            liveweer = data["liveweer"][0]
-            default_condition = "Unknown"
-            
-            liveweer["image"] = liveweer.get("image", default_condition)
-            liveweer["d0weer"] = liveweer.get("d0weer", default_condition)
-            liveweer["d1weer"] = liveweer.get("d1weer", default_condition)
-            liveweer["d2weer"] = liveweer.get("d2weer", default_condition)
-        
-        return data
-
-
     async def _handle_notification_dismissal(self) -> None:
         """Dismiss the notification if it exists."""
-        if self.notification_id is not None and self.notification_exists():
+        if self.notification_exists():
             await async_dismiss_notification(self.hass, self.notification_id)
-            self.notification_id = None
 
     async def _handle_error_logging(self, exception, url: str = None) -> None:
         """Handle and log errors."""
@@ -174,52 +203,37 @@ class KnmiApiClient:
         else:
             _LOGGER.error("Error: %s", exception)
 
-    def old_notification_exists(self) -> bool:
-        """Check if the notification with notification_id exists."""
-        notifications = self.hass.data.get("persistent_notification", [])
-        if isinstance(notifications, dict):
-            # Check if notifications is a dictionary
-            _LOGGER.debug("notifications is a dictionary")
-            exists = any(
-                notification.get("notification_id") == self.notification_id
-                for notification in notifications.values()
-            )
-            _LOGGER.debug("notification_exists: %s", exists)
-            return exists
-        return False
-    
     def notification_exists(self) -> bool:
         """Check if the notification with notification_id exists."""
-        notifications = self.hass.data.get("persistent_notification", {})
-        
-        if not isinstance(notifications, dict):
-            _LOGGER.debug("notifications is not a dictionary")
-            return False
-
-        existing_notification = notifications.get(self.notification_id)
-        
-        if existing_notification is not None:
-            _LOGGER.debug("Notification exists: %s", self.notification_id)
-            return True
-        
-        _LOGGER.debug("Notification does not exist: %s", self.notification_id)
-        return False
-
-    # 502, message='Bad Gateway'    
+        return self.notification_id in self.hass.data.get("persistent_notification", {})
+
     async def async_fetch_daily_forecast_data(self) -> list[dict]:
-        """Fetch daily forecast data from the KNMI API."""
-        try:
-            url = API_ENDPOINT.format(self.api_key, self.latitude, self.longitude)
-            async with async_timeout.timeout(API_TIMEOUT):
-                response = await self._session.get(url)
-                response.raise_for_status()
+        """Get the daily forecast data from the KNMI API."""
+        data = await self._async_get_payload()
+        return data.get("forecast", []) if data else []
 
-                #data = await self._parse_json_response(response)
-                response_text = await response.text()
-                data = await self._parse_json_response(response, response_text)
 
-                if not data is None:
-                    return data.get("forecast", [])
+def _intern_keys(data):
+    """Intern the keys of the payload and its liveweer and forecast items.
 
-        except aiohttp.ClientError as e:
-            raise KnmiApiException(f"Error fetching daily forecast data: {e}")
\ No newline at end of file
+    Lookups with the (interned) key literals used by the integration then
+    match on identity.
+    """
+    if not isinstance(data, dict):
+        return data
+    intern = sys.intern
+    for list_key in ("liveweer", "forecast"):
+        items = data.get(list_key)
+        if isinstance(items, list):
+            data[list_key] = [
+                {intern(k): v for k, v in item.items()} if isinstance(item, dict) else item
+                for item in items
+            ]
+    return {intern(k): v for k, v in data.items()}
+
+
+_ERROR_DISPATCH: dict[bytes, Callable[[KnmiApiClient], KNMIError]] = {
+    _ERROR_INVALID_API_KEY: KnmiApiClient._invalid_api_key_error,
+    _ERROR_DAILY_LIMIT: KnmiApiClient._requests_exceeded_error,
+    _ERROR_SERVER: KnmiApiClient._server_error,
+}
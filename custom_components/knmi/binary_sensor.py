@@ -1,10 +1,11 @@
 """KNMI Binary Sensor Platform."""
 # binary_sensor.py
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Callable
+from zoneinfo import ZoneInfo
 
-import pytz
 from homeassistant.components.binary_sensor import DOMAIN as SENSOR_DOMAIN
 from homeassistant.components.binary_sensor import (BinarySensorDeviceClass,
                                                     BinarySensorEntity)
@@ -19,6 +20,13 @@ from homeassistant.util import dt
 from .const import API_TIMEZONE, ATTRIBUTION, DOMAIN
 from .coordinator import KnmiDataUpdateCoordinator
 
+_TZ = ZoneInfo(API_TIMEZONE)
+
+# Parsed "HH:MM" strings keyed by (local date, time string).
+_TIME_CACHE: dict[tuple[str, str], datetime] = {}
+
+_ATTRIBUTION_ITEM: dict[str, str] = {"attribution": ATTRIBUTION}
+
 
 class KnmiBinarySensor(CoordinatorEntity[KnmiDataUpdateCoordinator], BinarySensorEntity):
     """Defines a KNMI binary sensor."""
@@ -64,72 +72,84 @@ def is_alarm_on(coordinator: KnmiDataUpdateCoordinator) -> bool:
 
 def is_sun_up(coordinator: KnmiDataUpdateCoordinator) -> bool:
     """Return True if the sun is currently up."""
-    sup = coordinator.get_value("sup", str)
-    sunder = coordinator.get_value("sunder", str)
+    sunrise, sunset = _sun_times(coordinator)
 
-    if sup is None or sunder is None:
+    if sunrise is None or sunset is None:
         return None
 
-    sunrise = _time_as_datetime(sup)
-    sunset = _time_as_datetime(sunder)
-
     now = dt.utcnow()
 
     return sunrise < now < sunset
 
 
+def _sun_times(
+    coordinator: KnmiDataUpdateCoordinator,
+) -> tuple[datetime | None, datetime | None]:
+    """Return today's sunrise and sunset in UTC."""
+    sup = coordinator.get_value("sup", str)
+    sunder = coordinator.get_value("sunder", str)
+    return (
+        _time_as_datetime(sup) if sup is not None else None,
+        _time_as_datetime(sunder) if sunder is not None else None,
+    )
+
+
 def _time_as_datetime(time: str) -> datetime:
     """Parse a time from a string like "08:13" to a datetime in UTC."""
-    time_array = time.split(":")
-    hour, minute = map(int, time_array)
-    timezone = pytz.timezone(API_TIMEZONE)
-    now = dt.now(timezone)
-    time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-    return dt.as_utc(time)
+    now = datetime.now(_TZ)
+    today = now.date().isoformat()
+    key = (today, time)
+    if (cached := _TIME_CACHE.get(key)) is not None:
+        return cached
 
+    # Entries of previous days are never used again
+    for stale_key in [k for k in _TIME_CACHE if k[0] != today]:
+        del _TIME_CACHE[stale_key]
 
-def get_alarm_attributes(coordinator: KnmiDataUpdateCoordinator) -> dict[str, Any]:
-    """Return entity specific state attributes for the alarm sensor."""
-    if is_alarm_on(coordinator):
-        timestamp_int = int(coordinator.get_value("timestamp"))
-        timestamp = datetime.fromtimestamp(timestamp_int).strftime("%Y-%m-%d %H:%M:%S")
-        alarmtxt = coordinator.get_value("alarmtxt")
+    hour, minute = map(int, time.split(":"))
+    parsed = now.replace(hour=hour, minute=minute, second=0, microsecond=0).astimezone(
+        timezone.utc
+    )
+    _TIME_CACHE[key] = parsed
+    return parsed
 
-        attributes = {
-            "Timestamp": timestamp,
-            "Waarschuwing": alarmtxt,
-            "attribution": ATTRIBUTION
-        }
-        
-        return attributes
 
+def get_alarm_attributes(coordinator: KnmiDataUpdateCoordinator) -> dict[str, Any] | None:
+    """Return entity specific state attributes for the alarm sensor."""
+    if not is_alarm_on(coordinator):
+        return None
 
-def get_sun_attributes(coordinator: KnmiDataUpdateCoordinator) -> dict[str, Any] | None:
-    """Return entity specific state attributes for the sun sensor."""
-    attributes = {}
+    timestamp = _format_timestamp(int(coordinator.get_value("timestamp")))
+    alarmtxt = coordinator.get_value("alarmtxt")
 
-    sup = coordinator.get_value("sup", str)
-    sunder = coordinator.get_value("sunder", str)
-    d0zon = coordinator.get_value("d0zon", int)
-    d1zon = coordinator.get_value("d1zon", int)
-    d2zon = coordinator.get_value("d2zon", int)
-
-    if sup is not None:
-        attributes["Zonsopkomst"] = _time_as_datetime(sup).isoformat()
-    if sunder is not None:
-        attributes["Zonsondergang"] = _time_as_datetime(sunder).isoformat()
-    if d0zon is not None:
-        attributes["Zonkans vandaag"] = d0zon
-    if d1zon is not None:
-        attributes["Zonkans morgen"] = d1zon
-    if d2zon is not None:
-        attributes["Zonkans overmorgen"] = d2zon
-
-    attributes["attribution"] = ATTRIBUTION
+    attributes = {
+        "Timestamp": timestamp,
+        "Waarschuwing": alarmtxt,
+        "attribution": ATTRIBUTION
+    }
 
     return attributes
 
 
+@lru_cache(maxsize=8)
+def _format_timestamp(timestamp: int) -> str:
+    """Format a unix timestamp as a local date and time string."""
+    return dt.as_local(dt.utc_from_timestamp(timestamp)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def get_sun_attributes(coordinator: KnmiDataUpdateCoordinator) -> dict[str, Any] | None:
+    """Return entity specific state attributes for the sun sensor."""
+    sunrise, sunset = _sun_times(coordinator)
+    values = (
+        ("Zonsopkomst", sunrise.isoformat() if sunrise is not None else None),
+        ("Zonsondergang", sunset.isoformat() if sunset is not None else None),
+        ("Zonkans vandaag", coordinator.get_value("d0zon", int)),
+        ("Zonkans morgen", coordinator.get_value("d1zon", int)),
+        ("Zonkans overmorgen", coordinator.get_value("d2zon", int)),
+    )
+    return {name: value for name, value in values if value is not None} | _ATTRIBUTION_ITEM
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
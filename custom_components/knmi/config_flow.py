@@ -19,6 +19,26 @@ from .exceptions import (KnmiApiClientApiKeyError,
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
 
+# Platform toggles of the options form, in display order
+_SORTED_PLATFORMS = tuple(sorted(PLATFORMS))
+
+
+def _build_user_schema(defaults: dict[str, Any]) -> vol.Schema:
+    """Return the user step form schema with the given defaults."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_NAME, default=defaults[CONF_NAME]): str,
+            vol.Required(CONF_LATITUDE, default=defaults[CONF_LATITUDE]): cv.latitude,
+            vol.Required(CONF_LONGITUDE, default=defaults[CONF_LONGITUDE]): cv.longitude,
+            vol.Required(CONF_API_KEY, default=defaults[CONF_API_KEY]): str,
+            vol.Required(
+                "refresh_interval",
+                default=defaults["refresh_interval"],
+                description="Enter the refresh interval in seconds",
+            ): int,
+        }
+    )
+
 
 class KNMIWeatherFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for knmi."""
@@ -69,25 +89,13 @@ class KNMIWeatherFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_LATITUDE: self.hass.config.latitude,
                 CONF_LONGITUDE: self.hass.config.longitude,
                 CONF_API_KEY: self._get_existing_api_key(),
-                "refresh_interval": DATA_REFRESH_INTERVAL,  # Default to 300 seconds (5 minutes)
+                "refresh_interval": DATA_REFRESH_INTERVAL,  # Default to 600 seconds (10 minutes)
                 CONF_SCAN_INTERVAL: SCAN_INTERVAL
             }
 
             return self.async_show_form(
                 step_id="user",
-                data_schema=vol.Schema(
-                    {
-                        vol.Required(CONF_NAME, default=defaults[CONF_NAME]): str,
-                        vol.Required(CONF_LATITUDE, default=defaults[CONF_LATITUDE]): cv.latitude,
-                        vol.Required(CONF_LONGITUDE, default=defaults[CONF_LONGITUDE]): cv.longitude,
-                        vol.Required(CONF_API_KEY, default=defaults[CONF_API_KEY]): str,
-                        vol.Required(
-                            "refresh_interval",
-                            default=defaults["refresh_interval"],
-                            description="Enter the refresh interval in seconds",
-                        ): int,
-                    }
-                ),
+                data_schema=_build_user_schema(defaults),
                 errors=self._errors,
         )
 
@@ -111,48 +119,19 @@ class KNMIWeatherFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _show_config_form(self, user_input):  # pylint: disable=unused-argument
         """Show the configuration form to edit location data."""
-
-        # Create a description for the refresh_interval field
         help_text = (
             "The refresh interval in seconds determines how often the data is "
             "retrieved from the KNMI API. A lower value will result in more frequent "
-            "updates but may consume more resources. The default value is 600 seconds "
-            "(10 minutes)."
+            "updates but may consume more resources. The default value is "
+            f"{DATA_REFRESH_INTERVAL} seconds ({DATA_REFRESH_INTERVAL // 60} minutes)."
         )
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_NAME, default=user_input[CONF_NAME]): str,
-                    vol.Required(
-                        CONF_LATITUDE, default=user_input[CONF_LATITUDE]
-                    ): cv.latitude,
-                    vol.Required(
-                        CONF_LONGITUDE, default=user_input[CONF_LONGITUDE]
-                    ): cv.longitude,
-                    vol.Required(CONF_API_KEY, default=user_input[CONF_API_KEY]): str,
-                    vol.Required(
-                        "refresh_interval",
-                        default=600,  # Default to 600 seconds (10 minutes)
-                        titel=help_text,
-                        description={"suggested_value": "suggested value"},
-                    ): int,
-                }
+            data_schema=_build_user_schema(
+                {**user_input, "refresh_interval": DATA_REFRESH_INTERVAL}
             ),
-            description=(
-                "The refresh interval in seconds determines how often the data is "
-                "retrieved from the KNMI API. A lower value will result in more frequent "
-                "updates but may consume more resources. The default value is 300 seconds "
-                "(5 minutes)."
-            ),
-            description_placeholders={
-                "help_text": (
-                    "The refresh interval in seconds determines how often the data is "
-                    "retrieved from the KNMI API. A lower value will result in more frequent "
-                    "updates but may consume more resources. The default value is 300 seconds "
-                    "(5 minutes)."
-                )
-            },
+            description=help_text,
+            description_placeholders={"help_text": help_text},
             errors=self._errors,
         )
 
@@ -196,37 +175,22 @@ class KnmiOptionsFlowHandler(config_entries.OptionsFlow):
             self.hass.config_entries.async_update_entry(self.config_entry, options=self.options)
             return await self._update_options()
 
-        defaults = {
-            CONF_NAME: self.hass.config.location_name,
-            CONF_LATITUDE: self.hass.config.latitude,
-            CONF_LONGITUDE: self.hass.config.longitude,
-            CONF_API_KEY: self._get_existing_api_key(),
-            "refresh_interval": self.options.get("refresh_interval", DATA_REFRESH_INTERVAL),
+        schema = {
+            vol.Required(x, default=self.options.get(x, True)): bool
+            for x in _SORTED_PLATFORMS
         }
+        schema[
+            vol.Required(
+                "refresh_interval",
+                default=self.options.get("refresh_interval", DATA_REFRESH_INTERVAL),
+                description="Enter the refresh interval in seconds",
+            )
+        ] = int
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(x, default=self.options.get(x, True)): bool
-                for x in sorted(PLATFORMS)
-            },
-            extra=vol.ALLOW_EXTRA,
-        )
-
-        refresh_interval_schema = vol.Schema(
-            {
-                vol.Required(
-                    "refresh_interval",
-                    default=defaults["refresh_interval"],
-                    description="Enter the refresh interval in seconds",
-                ): int
-            }
+        return self.async_show_form(
+            step_id="user", data_schema=vol.Schema(schema, extra=vol.ALLOW_EXTRA)
         )
 
-        combined_schema = data_schema.schema.copy()
-        combined_schema.update(refresh_interval_schema.schema)
-
-        return self.async_show_form(step_id="user", data_schema=vol.Schema(combined_schema, extra=vol.ALLOW_EXTRA))
-
     async def _update_options(self) -> None:
         """Update config entry options."""
         return self.async_create_entry(
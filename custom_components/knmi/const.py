@@ -1,12 +1,20 @@
 """Constants for knmi."""
 # const.py
 
+import bisect
 import logging
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import timedelta
+from types import MappingProxyType
 from typing import Any, Final
 
-from homeassistant.components.binary_sensor import BinarySensorDeviceClass
-from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass, BinarySensorEntityDescription)
+from homeassistant.components.sensor import (SensorDeviceClass,
+                                             SensorEntityDescription,
+                                             SensorStateClass)
 from homeassistant.components.weather import (ATTR_CONDITION_CLEAR_NIGHT,
                                               ATTR_CONDITION_CLOUDY,
                                               ATTR_CONDITION_FOG,
@@ -24,6 +32,27 @@ from homeassistant.const import (DEGREE, PERCENTAGE, UnitOfLength,
                                  UnitOfPressure, UnitOfSpeed,
                                  UnitOfTemperature)
 
+# Enum members used by several sensor descriptions below
+_SC_M = SensorStateClass.MEASUREMENT
+_DC_T = SensorDeviceClass.TEMPERATURE
+_DC_P = SensorDeviceClass.PRESSURE
+_DC_WS = SensorDeviceClass.WIND_SPEED
+
+
+@dataclass(frozen=True, kw_only=True)
+class KnmiSensorDescription(SensorEntityDescription):
+    """Describes a KNMI sensor and the extra state attributes it exposes."""
+
+    attributes: tuple[Mapping[str, Any], ...] = ()
+
+
+@dataclass(frozen=True, kw_only=True)
+class KnmiBinarySensorDescription(BinarySensorEntityDescription):
+    """Describes a KNMI binary sensor and the extra state attributes it exposes."""
+
+    attributes: tuple[Mapping[str, Any], ...] = ()
+
+
 # API
 API_ENDPOINT: Final[str] = "https://weerlive.nl/api/json-data-10min.php?key={}&locatie={},{}"
 API_TIMEOUT: Final[int] = 15
@@ -54,240 +83,220 @@ DATA_REFRESH_INTERVAL: Final[int] = 600
 BINARY_SENSOR: Final[str] = "binary_sensor"
 SENSOR: Final[str] = "sensor"
 WEATHER: Final[str] = "weather"
-PLATFORMS: Final[list[str]] = [BINARY_SENSOR, SENSOR, WEATHER]
-
-# Icon templates (not in use)
-ICON_TEMPLATE: Final[str] = "mdi:weather-{}"
-WIND_DIRECTION_TEMPLATE: Final[str] = "mdi:weather-windy-{}"
-
-# Conversion values
-KMH_KNOT: Final[float] = 0.53996  # knots
-MS_KNOT: Final[float] = 1.9438  # knots
-KNOT_KMH: Final[float] = 1.852  # km/h
-KNOT_MS: Final[float] = 0.5144  # m/s
-KMH_MS: Final[float] = 0.2778  # m/s
-MS_KMH: Final[float] = 3.6  # km/h
-hPa_mmHg: Final[float] = 0.75006  # mmHg
-mmHg_hPa: Final[float] = 1.33322  # hPa
+PLATFORMS: Final[frozenset[str]] = frozenset((BINARY_SENSOR, SENSOR, WEATHER))
 
 # Binary sensors
-BINARY_SENSORS: Final[list[dict[str, Any]]] = [
-    {
-        "name": "Waarschuwing",
-        "unit": "",
-        "icon": "mdi:alert",
-        "key": "alarm",
-        "device_class": BinarySensorDeviceClass.SAFETY,
-        "attributes": [
-            {
-                "name": "Waarschuwing",
-                "key": "alarmtxt",
-            },
-        ],
-    },
-]
+BINARY_SENSORS: Final[tuple[KnmiBinarySensorDescription, ...]] = (
+    KnmiBinarySensorDescription(
+        key="alarm",
+        name="Waarschuwing",
+        icon="mdi:alert",
+        device_class=BinarySensorDeviceClass.SAFETY,
+        attributes=(
+            MappingProxyType({"name": "Waarschuwing", "key": "alarmtxt"}),
+        ),
+    ),
+)
 
 # Sensors
-SENSORS: Final[list] = [
-    {
-        "name": "Omschrijving",
-        "icon": "mdi:text",
-        "key": "samenv",
-    },
-    {
-        "name": "Plaats",
-        "icon": "mdi:map-marker",
-        "key": "plaats",
-    },
-    {
-        "name": "Korte dagverwachting",
-        "icon": "mdi:text",
-        "key": "verw",
-    },
-    {
-        "name": "Dauwpunt",
-        "unit_of_measurement": UnitOfTemperature.CELSIUS,
-        "icon": "mdi:thermometer",
-        "key": "dauwp",
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Gevoelstemperatuur",
-        "unit_of_measurement": UnitOfTemperature.CELSIUS,
-        "icon": "mdi:thermometer",
-        "key": "gtemp",
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Temperatuur",
-        "unit_of_measurement": UnitOfTemperature.CELSIUS,
-        "icon": "mdi:thermometer",
-        "key": "temp",
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Minimum temperatuur",
-        "unit_of_measurement": UnitOfTemperature.CELSIUS,
-        "icon": "mdi:thermometer-chevron-down",
-        "key": "d0tmin",
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Maximum temperatuur",
-        "unit_of_measurement": UnitOfTemperature.CELSIUS,
-        "icon": "mdi:thermometer-chevron-up",
-        "key": "d0tmax",
-        "device_class": SensorDeviceClass.TEMPERATURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Temperatuur omschrijving",
-        "icon": "mdi:text",
-        "key": "tempdesc",
-    },
-    {
-        "name": "Windrichting",
-        "icon": "mdi:compass-outline",
-        "key": "windr",
-        "state_class": SensorStateClass.MEASUREMENT
-    },
-    {
-        "name": "Windrichting graden",
-        "unit_of_measurement": DEGREE,
-        "icon": "mdi:compass-outline",
-        'device_class': 'direction',
-        "key": "windrgr",
-        "state_class": SensorStateClass.MEASUREMENT
-    },
-    {
-        "name": "Windsnelheid m/s",
-        "unit_of_measurement": UnitOfSpeed.METERS_PER_SECOND,
-        "icon": "mdi:weather-windy",
-        "key": "windms",
-        "device_class": SensorDeviceClass.WIND_SPEED,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Windsnelheid km/h",
-        "unit_of_measurement": UnitOfSpeed.KILOMETERS_PER_HOUR,
-        "icon": "mdi:weather-windy",
-        "key": "windkmh",
-        "device_class": SensorDeviceClass.WIND_SPEED,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Windsnelheid knopen",
-        "unit_of_measurement": UnitOfSpeed.KNOTS,
-        "icon": "mdi:weather-windy",
-        "key": "windk",
-        "device_class": SensorDeviceClass.WIND_SPEED,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Windkracht Beaufort",
-        "unit_of_measurement": WIND_BEAUFORT,
-        "icon": "mdi:weather-windy",
-        "key": "winds",
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Wind omschrijving",
-        "icon": "mdi:text",
-        "key": "winddesc",
-    },
-    {
-        "name": "Relatieve luchtvochtigheid",
-        "unit_of_measurement": PERCENTAGE,
-        "icon": "mdi:water-percent",
-        "key": "lv",
-        "device_class": SensorDeviceClass.HUMIDITY,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Luchtvochtigheid omschrijving",
-        "icon": "mdi:text",
-        "key": "lvdesc",
-    },
-    {
-        "name": "Luchtdruk",
-        "unit_of_measurement": UnitOfPressure.HPA,
-        "icon": "mdi:gauge",
-        "key": "luchtd",
-        "device_class": SensorDeviceClass.PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Luchtdruk mmHg",
-        "unit_of_measurement": UnitOfPressure.MMHG,
-        "icon": "mdi:gauge",
-        "key": "ldmmhg",
-        "device_class": SensorDeviceClass.PRESSURE,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Luchtdruk omschrijving",
-        "icon": "mdi:text",
-        "key": "air_pressure_desc",
-    },
-    {
-        "name": "Barometer",
-        "icon": "mdi:text",
-        "key": "air_pressure_barometer",
-    },
-    {
-        "name": "Zicht",
-        "unit_of_measurement": UnitOfLength.KILOMETERS,
-        "icon": "mdi:arrow-left-right",
-        "key": "zicht",
-        "device_class": SensorDeviceClass.DISTANCE,
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Zicht omschrijving",
-        "icon": "mdi:text",
-        "key": "zichtdesc",
-    },
-    {
-        "name": "Zonsopkomst",
-        "icon": "mdi:weather-sunset-up",
-        "key": "sup",
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Zonsondergang",
-        "icon": "mdi:weather-sunset-down",
-        "key": "sunder",
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Kans op neerslag vandaag",
-        "unit_of_measurement": PERCENTAGE,
-        "icon": "mdi:weather-rainy",
-        "key": "d0neerslag",
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Kans op zon vandaag",
-        "unit_of_measurement": PERCENTAGE,
-        "icon": "mdi:weather-sunny",
-        "key": "d0zon",
-        "state_class": SensorStateClass.MEASUREMENT,
-    },
-    {
-        "name": "Laatste update",
-        "icon": "mdi:clock",
-        "device_class": None,
-        "attributes": [],
-        "key": "timestamp",
-    },
-]
+SENSORS: Final[tuple[KnmiSensorDescription, ...]] = (
+    KnmiSensorDescription(
+        key="samenv",
+        name="Omschrijving",
+        icon="mdi:text",
+    ),
+    KnmiSensorDescription(
+        key="plaats",
+        name="Plaats",
+        icon="mdi:map-marker",
+    ),
+    KnmiSensorDescription(
+        key="verw",
+        name="Korte dagverwachting",
+        icon="mdi:text",
+    ),
+    KnmiSensorDescription(
+        key="dauwp",
+        name="Dauwpunt",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        icon="mdi:thermometer",
+        device_class=_DC_T,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="gtemp",
+        name="Gevoelstemperatuur",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        icon="mdi:thermometer",
+        device_class=_DC_T,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="temp",
+        name="Temperatuur",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        icon="mdi:thermometer",
+        device_class=_DC_T,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="d0tmin",
+        name="Minimum temperatuur",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        icon="mdi:thermometer-chevron-down",
+        device_class=_DC_T,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="d0tmax",
+        name="Maximum temperatuur",
+        native_unit_of_measurement=UnitOfTemperature.CELSIUS,
+        icon="mdi:thermometer-chevron-up",
+        device_class=_DC_T,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="tempdesc",
+        name="Temperatuur omschrijving",
+        icon="mdi:text",
+    ),
+    KnmiSensorDescription(
+        key="windr",
+        name="Windrichting",
+        icon="mdi:compass-outline",
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="windrgr",
+        name="Windrichting graden",
+        native_unit_of_measurement=DEGREE,
+        icon="mdi:compass-outline",
+        device_class="direction",
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="windms",
+        name="Windsnelheid m/s",
+        native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND,
+        icon="mdi:weather-windy",
+        device_class=_DC_WS,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="windkmh",
+        name="Windsnelheid km/h",
+        native_unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        icon="mdi:weather-windy",
+        device_class=_DC_WS,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="windk",
+        name="Windsnelheid knopen",
+        native_unit_of_measurement=UnitOfSpeed.KNOTS,
+        icon="mdi:weather-windy",
+        device_class=_DC_WS,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="winds",
+        name="Windkracht Beaufort",
+        native_unit_of_measurement=WIND_BEAUFORT,
+        icon="mdi:weather-windy",
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="winddesc",
+        name="Wind omschrijving",
+        icon="mdi:text",
+    ),
+    KnmiSensorDescription(
+        key="lv",
+        name="Relatieve luchtvochtigheid",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:water-percent",
+        device_class=SensorDeviceClass.HUMIDITY,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="lvdesc",
+        name="Luchtvochtigheid omschrijving",
+        icon="mdi:text",
+    ),
+    KnmiSensorDescription(
+        key="luchtd",
+        name="Luchtdruk",
+        native_unit_of_measurement=UnitOfPressure.HPA,
+        icon="mdi:gauge",
+        device_class=_DC_P,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="ldmmhg",
+        name="Luchtdruk mmHg",
+        native_unit_of_measurement=UnitOfPressure.MMHG,
+        icon="mdi:gauge",
+        device_class=_DC_P,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="air_pressure_desc",
+        name="Luchtdruk omschrijving",
+        icon="mdi:text",
+    ),
+    KnmiSensorDescription(
+        key="air_pressure_barometer",
+        name="Barometer",
+        icon="mdi:text",
+    ),
+    KnmiSensorDescription(
+        key="zicht",
+        name="Zicht",
+        native_unit_of_measurement=UnitOfLength.KILOMETERS,
+        icon="mdi:arrow-left-right",
+        device_class=SensorDeviceClass.DISTANCE,
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="zichtdesc",
+        name="Zicht omschrijving",
+        icon="mdi:text",
+    ),
+    KnmiSensorDescription(
+        key="sup",
+        name="Zonsopkomst",
+        icon="mdi:weather-sunset-up",
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="sunder",
+        name="Zonsondergang",
+        icon="mdi:weather-sunset-down",
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="d0neerslag",
+        name="Kans op neerslag vandaag",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:weather-rainy",
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="d0zon",
+        name="Kans op zon vandaag",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:weather-sunny",
+        state_class=_SC_M,
+    ),
+    KnmiSensorDescription(
+        key="timestamp",
+        name="Laatste update",
+        icon="mdi:clock",
+    ),
+)
 
 # Map weather conditions from KNMI to HA.
-CONDITIONS_MAP: Final[dict[str, str]] = {
+CONDITIONS_MAP: Final[Mapping[str, str]] = MappingProxyType({
     "bliksem": ATTR_CONDITION_LIGHTNING,
     "bliksemregen": ATTR_CONDITION_LIGHTNING_RAINY,
     "regen": ATTR_CONDITION_RAINY,
@@ -307,10 +316,16 @@ CONDITIONS_MAP: Final[dict[str, str]] = {
     "wind": ATTR_CONDITION_WINDY,
     "zonnig": ATTR_CONDITION_SUNNY,
     "zwaarbewolkt": ATTR_CONDITION_CLOUDY,
-}
+})
+
+
+def condition_to_ha(condition: str) -> str | None:
+    """Return the HA condition for a KNMI condition like "halfbewolkt"."""
+    return CONDITIONS_MAP.get(condition)
+
 
 # Map wind direction from KNMI string to number.
-WIND_DIRECTION_MAP: Final[dict[str, float | None]] = {
+_WIND_DIRECTIONS: dict[str, float | None] = {
     "VAR": None,
     "N": 360,
     "Noord": 360,
@@ -333,9 +348,18 @@ WIND_DIRECTION_MAP: Final[dict[str, float | None]] = {
     "NW": 315,
     "NNW": 337.5,
 }
+WIND_DIRECTION_MAP: Final[Mapping[str, float | None]] = MappingProxyType(
+    {sys.intern(direction): degrees for direction, degrees in _WIND_DIRECTIONS.items()}
+)
+
+
+def wind_dir_to_deg(direction: str) -> float | None:
+    """Return the bearing in degrees for a KNMI wind direction like "ZW"."""
+    return WIND_DIRECTION_MAP.get(direction)
+
 
 # Define the wind directions and their corresponding icon names
-WIND_DIRECTIONS_ICON_MAP = {
+WIND_DIRECTIONS_ICON_MAP: Final[Mapping[int, str]] = MappingProxyType({
     0: 'arrow-down-thick',
     45: 'arrow-bottom-left-thick',
     90: 'arrow-left-thick',
@@ -344,9 +368,20 @@ WIND_DIRECTIONS_ICON_MAP = {
     225: 'arrow-top-right-thick',
     270: 'arrow-right-thick',
     315: 'arrow-bottom-right-thick',
-}
+})
+
+# Icon for every whole degree, the nearest of the eight directions above
+_ICON_BEARINGS: Final[tuple[int, ...]] = (0, 45, 90, 135, 180, 225, 270, 315)
+_ICONS: Final[tuple[str, ...]] = tuple(WIND_DIRECTIONS_ICON_MAP[b] for b in _ICON_BEARINGS)
+_ICON_LUT: Final[bytes] = bytes(int(((d + 22.5) % 360) // 45) for d in range(360))
+
 
-TEMPERATURE_MAP: Final[dict[str, dict[str, any]]] = {
+def icon_for_bearing(degrees: float) -> str:
+    """Return the WIND_DIRECTIONS_ICON_MAP icon name nearest to a bearing."""
+    return _ICONS[_ICON_LUT[int(degrees) % 360]]
+
+
+TEMPERATURE_MAP: Final[Mapping[str, dict[str, Any]]] = MappingProxyType({
     "-30": {
         "range": (-30, -20),
         "short_description": "Extreem koud",
@@ -412,18 +447,18 @@ TEMPERATURE_MAP: Final[dict[str, dict[str, any]]] = {
         "short_description": "Extreem heet",
         "description": "Levensbedreigende omstandigheden voor de meeste mensen."
     },
-}
+})
 
-TEMPERATURE_ALERT_MAP: Final[dict[str, dict[str, Any]]] = {
+TEMPERATURE_ALERT_MAP: Final[Mapping[str, dict[str, Any]]] = MappingProxyType({
     "geel_koud": {"range": (-5, 0), "description": "Code geel", "alert": "Code Geel: Vorstwaarschuwing voor lichte vorst"},
     "oranje_koud": {"range": (-10, -6), "description": "Code oranje", "alert": "Code Oranje: Vorstwaarschuwing voor matige vorst"},
     "rood_koud": {"range": (-50, -11), "description": "Code rood", "alert": "Code Rood: Vorstwaarschuwing voor strenge vorst"},
     "geel_warm": {"range": (25, 30), "description": "Code geel", "alert": "Code Geel: Waarschuwing voor aanhoudend warm weer"},
     "oranje_warm": {"range": (30, 35), "description": "Code oranje", "alert": "Code Oranje: Waarschuwing voor hitte"},
     "rood_warm": {"range": (35, 40), "description": "Code rood", "alert": "Code Rood: Waarschuwing voor extreme hitte"},
-}
+})
 
-AIR_PRESSURE_MAP: Final[dict[str, dict[str, Any]]] = {
+AIR_PRESSURE_MAP: Final[Mapping[str, dict[str, Any]]] = MappingProxyType({
     "extreem_laag": {"range": (900, 940), "short_description": "Extreem laag", "barometer": "Orkaan"},
     "zeer_laag": {"range": (940, 970), "short_description": "Zeer laag", "barometer": "Stormachtig"},
     "laag": {"range": (970, 990), "short_description": "Laag", "barometer": "Regenachtig"},
@@ -432,10 +467,10 @@ AIR_PRESSURE_MAP: Final[dict[str, dict[str, Any]]] = {
     "hoog": {"range": (1030, 1050), "short_description": "Hoog", "barometer": "Droog"},
     "zeer_hoog": {"range": (1050, 1100), "short_description": "Zeer hoog", "barometer": "Zeer droog"},
     "extreem_hoog": {"range": (1100, 1200), "short_description": "Extreem hoog", "barometer": "Uitzonderlijk droog"},
-}
+})
 
 # Wind force mapping using Beaufort scale
-WIND_FORCE_MAP: Final[dict[int, dict[str, Any]]] = {
+WIND_FORCE_MAP: Final[Mapping[int, dict[str, Any]]] = MappingProxyType({
     0: {
         "windsnelheid_kmh": 0,
         "windsnelheid_ms": 0,
@@ -514,9 +549,24 @@ WIND_FORCE_MAP: Final[dict[int, dict[str, Any]]] = {
         "benaming": "Orkaan",
         "uitwerking": "Verwoestingen"
     }
-}
+})
+
+# The wind force map as parallel tuples, indexed by Beaufort number
+_BFT_KMH: Final[tuple[int, ...]] = tuple(WIND_FORCE_MAP[i]["windsnelheid_kmh"] for i in range(13))
+_BFT_NAME: Final[tuple[str, ...]] = tuple(WIND_FORCE_MAP[i]["benaming"] for i in range(13))
+
+
+def bft_from_kmh(speed: float) -> int:
+    """Return the Beaufort number for a wind speed in km/h."""
+    return max(0, min(12, bisect.bisect_right(_BFT_KMH, speed) - 1))
+
+
+def bft_name(bft: int) -> str | None:
+    """Return the name (benaming) of a Beaufort number."""
+    return _BFT_NAME[bft] if 0 <= bft <= 12 else None
 
-HUMIDITY_MAP: Final[dict[str, dict[str, Any]]] = {
+
+HUMIDITY_MAP: Final[Mapping[str, dict[str, Any]]] = MappingProxyType({
     "ultra_low": {
         "range": (0, 10),
         "description": "Zeer lage luchtvochtigheid. Zeer droge lucht, kan ademhalingsongemakken veroorzaken.",
@@ -552,9 +602,9 @@ HUMIDITY_MAP: Final[dict[str, dict[str, Any]]] = {
         "description": "Extreem hoge luchtvochtigheid. Uiterst vochtige lucht, kan gezondheidsrisico's veroorzaken.",
         "short_description": "Zeer hoog"
     }
-}
+})
 
-VISIBILITY_MAP: Final[dict[str, dict[str, Any]]] = {
+VISIBILITY_MAP: Final[Mapping[str, dict[str, Any]]] = MappingProxyType({
     "very_poor": {
         "range": (0, 1),
         "description": "Zeer slecht zicht. Bijna geen zichtbaarheid, gevaarlijk voor weggebruikers.",
@@ -580,4 +630,63 @@ VISIBILITY_MAP: Final[dict[str, dict[str, Any]]] = {
         "description": "Zeer goed zicht. Uitstekende zichtbaarheid, zeer heldere omstandigheden.",
         "short_description": "Zeer goed"
     }
-}
\ No newline at end of file
+})
+
+# Range lookup tables: an index into the map values for every integer value
+# between the lowest and highest bound of the map, where the first matching
+# range wins. Values outside the ranges are not classified.
+_NO_RANGE: Final[int] = 0xFF
+
+
+def _build_range_lut(
+    mapping: Mapping[str, dict[str, Any]], inclusive: bool
+) -> tuple[int, bytes, tuple[dict[str, Any], ...]]:
+    """Build (lowest bound, lookup table, map values) for a map with ranges."""
+    values = tuple(mapping.values())
+    end = 1 if inclusive else 0
+    base = min(value["range"][0] for value in values)
+    lut = bytearray([_NO_RANGE]) * (max(value["range"][1] for value in values) + end - base)
+    for index, value in enumerate(values):
+        low, high = value["range"]
+        for i in range(low - base, high + end - base):
+            if lut[i] == _NO_RANGE:
+                lut[i] = index
+    return base, bytes(lut), values
+
+
+def _lookup_range(
+    table: tuple[int, bytes, tuple[dict[str, Any], ...]], value: float
+) -> dict[str, Any] | None:
+    """Return the map value whose range contains the integer part of value."""
+    base, lut, values = table
+    # Callers pass ints for humidity and visibility, only floats need truncating
+    i = (value if type(value) is int else int(value)) - base
+    if 0 <= i < len(lut) and (index := lut[i]) != _NO_RANGE:
+        return values[index]
+    return None
+
+
+_TEMPERATURE_LUT = _build_range_lut(TEMPERATURE_MAP, inclusive=True)
+_AIR_PRESSURE_LUT = _build_range_lut(AIR_PRESSURE_MAP, inclusive=True)
+_HUMIDITY_LUT = _build_range_lut(HUMIDITY_MAP, inclusive=False)
+_VISIBILITY_LUT = _build_range_lut(VISIBILITY_MAP, inclusive=False)
+
+
+def classify_temperature(temperature: float) -> dict[str, Any] | None:
+    """Return the TEMPERATURE_MAP entry for a temperature in Celsius."""
+    return _lookup_range(_TEMPERATURE_LUT, temperature)
+
+
+def classify_air_pressure(air_pressure: float) -> dict[str, Any] | None:
+    """Return the AIR_PRESSURE_MAP entry for an air pressure in hPa."""
+    return _lookup_range(_AIR_PRESSURE_LUT, air_pressure)
+
+
+def classify_humidity(humidity: float) -> dict[str, Any] | None:
+    """Return the HUMIDITY_MAP entry for a relative humidity in percent."""
+    return _lookup_range(_HUMIDITY_LUT, humidity)
+
+
+def classify_visibility(visibility: float) -> dict[str, Any] | None:
+    """Return the VISIBILITY_MAP entry for a visibility in km."""
+    return _lookup_range(_VISIBILITY_LUT, visibility)
@@ -1,8 +1,9 @@
 """DataUpdateCoordinator for knmi."""
 # coordinator.py
 
-import asyncio
-import random
+import hashlib
+import logging
+import time
 from datetime import datetime, timedelta
 from typing import Any, Callable
 
@@ -11,11 +12,15 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import (DataUpdateCoordinator,
                                                       UpdateFailed)
+from homeassistant.util import dt as dt_util
 
 from .api import KnmiApiClient
 from .const import _LOGGER, DATA_REFRESH_INTERVAL, DOMAIN
 from .model import WeatherData
 
+# Keys whose value can be a range like "12/14"
+_FRACTION_KEYS = frozenset(("d1tmin", "d1tmax", "d2tmin", "d2tmax"))
+
 
 class KnmiDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
@@ -31,52 +36,45 @@ class KnmiDataUpdateCoordinator(DataUpdateCoordinator):
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize."""
-        self.hass = hass
         self.config_entry = config_entry
         self.api = client
         self.device_info = device_info
         self.last_update_time: datetime | None = None
+        # last_update_time as shown by the "Laatste update" sensor
+        self.last_update_str: str | None = None
+        # Monotonic clock reading of the last update, immune to wall clock jumps
+        self._last_update_monotonic: float | None = None
         self._timestamp = None
+        # Converted values by (key, type), valid for the data object they came from
+        self._values: dict[tuple[str, Callable], Any] = {}
+        self._values_data: dict[str, Any] | None = None
 
         # Get the refresh interval from the config entry options
-        self.refresh_interval = self._get_refresh_interval()
-
-        # Set the SCAN_INTERVAL to the refresh_interval
-        self.update_interval = self.refresh_interval
-        SCAN_INTERVAL = timedelta(seconds=self.refresh_interval)
+        self.refresh_interval = self._get_refresh_interval(hass)
+        # Fixed per entry jitter of 1-60 seconds, so installations don't poll in lockstep
+        entry_id = config_entry.entry_id if config_entry else ""
+        self._jitter = (
+            int.from_bytes(hashlib.blake2s(entry_id.encode(), digest_size=1).digest(), "big")
+            % 60
+            + 1
+        )
 
         super().__init__(
-            hass=hass, logger=_LOGGER, name=DOMAIN, update_interval=SCAN_INTERVAL
+            hass=hass,
+            logger=_LOGGER,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=self.refresh_interval),
         )
 
-    def _get_refresh_interval(self) -> int:
+    def _get_refresh_interval(self, hass: HomeAssistant) -> int:
         """Get the refresh interval from the config entry options."""
-        _LOGGER.debug("Getting refresh_interval")
-        config_entry = self.config_entry
-        config_options = self.config_entry.options
-        if config_entry and "refresh_interval" in config_entry.options:
-            _LOGGER.debug("refresh_interval exists in options")
-            _LOGGER.debug("refresh_interval: %s", config_entry.options["refresh_interval"])
-            self.refresh_interval = config_entry.options["refresh_interval"]
-            return self.refresh_interval
-        # config_entry = self.hass.config_entries.async_get_entry(DOMAIN)
-        # if config_entry and "refresh_interval" in config_entry.options:
-        # refresh_interval = config_entry.options.get("refresh_interval", 300)
-        if self.options and "refresh_interval" in self.options:
-            _LOGGER.debug("refresh_interval exists in options")
-            return self.options["refresh_interval"]
-        refresh_interval = self.hass.data.get(DOMAIN, {}).get("refresh_interval", 300)
-        if refresh_interval:
-            _LOGGER.debug("refresh_interval exist 2: %s", refresh_interval)
-
-        if config_entry is None:
-            _LOGGER.debug("Config entry does not exist")
-        if config_entry:
-            _LOGGER.debug("Config entry options: %s", config_entry.options)
-            if "refresh_interval" in config_entry.options:
-                _LOGGER.debug("refresh_interval is %s", config_entry.options["refresh_interval"])
-                return config_entry.options["refresh_interval"]
-        return DATA_REFRESH_INTERVAL  # Default to 300 seconds (5 minutes)
+        options = self.config_entry.options if self.config_entry else {}
+        return (
+            options.get("refresh_interval")
+            or (self.options or {}).get("refresh_interval")
+            or hass.data.get(DOMAIN, {}).get("refresh_interval")
+            or DATA_REFRESH_INTERVAL
+        )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint.
@@ -84,14 +82,12 @@ class KnmiDataUpdateCoordinator(DataUpdateCoordinator):
         This is the place to pre-process the data to lookup tables
         so entities can quickly look up their data.
         """
-        if self.last_update_time is None:
-            _LOGGER.debug("last_update_time is None")
-        else:
-            _LOGGER.debug("last_update_time is NOT None", self.last_update_time)
-        if self._is_update_interval_passed():
-            _LOGGER.debug("is_update_interval_passed is True")
-        else:
-            _LOGGER.debug("is_update_interval_passed is False")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "last_update_time=%s is_update_interval_passed=%s",
+                self.last_update_time,
+                self._is_update_interval_passed(),
+            )
         # Only update data when the time now > timestamp in data plus 10 minutes
         # It makes no sense to update before data is updated, this saves unnecessary api calls
         if (
@@ -101,16 +97,22 @@ class KnmiDataUpdateCoordinator(DataUpdateCoordinator):
             try:
                 _LOGGER.debug("Fetching data from API...")
                 data = await self.api.async_get_data()
+                if (
+                    self.data is not None
+                    and self._timestamp is not None
+                    and data
+                    and data.get("timestamp") == self._timestamp
+                ):
+                    # Same observation as last time, keep the parsed data
+                    return self.data
                 # Use WeatherData to parse the data
                 weather_data = WeatherData(**data)
-                self.data = weather_data
                 self._update_timestamp(weather_data)
-                self._schedule_next_update()
-                # if self.api.notification_exists():
-                if self.notification_exists():
-                    _LOGGER.debug("Notification exists!")
-                else:
-                    _LOGGER.debug("Notification does not exist!")
+                self.update_interval = timedelta(
+                    seconds=self.refresh_interval + self._jitter
+                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("Notification exists: %s", self.api.notification_exists())
                 return data
                 # Use WeatherData to parse the data
                 # weather_data_list = parse_weather_data(knmi_data)
@@ -125,24 +127,59 @@ class KnmiDataUpdateCoordinator(DataUpdateCoordinator):
     def get_value(
         self, key: str, convert_to: Callable = str
     ) -> float | int | str | None:
-        """Get a value from the retrieved data and convert to given type"""
-        if key in self.data:
-            try:
-                if ("d1tmin" in key or "d1tmax" in key or "d2tmin" in key or "d2tmax" in key) and "/" in self.data.get(key, None):
-                    numerator, denominator = map(int, self.data.get(key, None).split('/'))
-                    return convert_to((numerator + denominator) / 2)
-                return convert_to(self.data.get(key, None))
-            except ValueError:
-                _LOGGER.warning("Value %s with key %s can't be converted to %s", self.data.get(key, None), key, convert_to)
-                return None
-        _LOGGER.warning("Value %s is missing in API response", key)
-        return None
+        """Get a value from the retrieved data and convert to given type.
+
+        Converted values are cached until the coordinator receives new data.
+        """
+        data = self.data
+        if data is None:
+            # No data before the first refresh has finished
+            return None
+        if data is not self._values_data:
+            self._values = {}
+            self._values_data = data
+
+        cache_key = (key, convert_to)
+        try:
+            return self._values[cache_key]
+        except KeyError:
+            value = self._values[cache_key] = self._convert_value(key, convert_to)
+            return value
+
+    def get_values(
+        self, spec: tuple[tuple[str, Callable], ...]
+    ) -> tuple[float | int | str | None, ...]:
+        """Get several values at once, spec holds (key, convert_to) pairs."""
+        get_value = self.get_value
+        return tuple(get_value(key, convert_to) for key, convert_to in spec)
+
+    def _convert_value(
+        self, key: str, convert_to: Callable
+    ) -> float | int | str | None:
+        """Convert a value from the retrieved data to the given type."""
+        value = self.data.get(key)
+        if value is None:
+            _LOGGER.warning("Value %s is missing in API response", key)
+            return None
+        try:
+            # Forecast temperatures can be a range like "12/14", use the middle
+            if key in _FRACTION_KEYS and isinstance(value, str):
+                low, sep, high = value.partition("/")
+                if sep:
+                    if convert_to is float:
+                        return (int(low) + int(high)) * 0.5
+                    return convert_to((int(low) + int(high)) / 2)
+            return convert_to(value)
+        except (ValueError, TypeError):
+            _LOGGER.warning("Value %s with key %s can't be converted to %s", value, key, convert_to)
+            return None
 
     def _is_update_interval_passed(self) -> bool:
         """Check if the update interval has passed since the last update."""
-        if self.last_update_time is None:
-            return True
-        return datetime.now() >= self.last_update_time + timedelta(seconds=600)
+        return (
+            self._last_update_monotonic is None
+            or time.monotonic() - self._last_update_monotonic >= self.refresh_interval
+        )
 
     def _update_timestamp(self, data: WeatherData) -> None:
         """Update the timestamp based on the fetched data."""
@@ -152,33 +189,15 @@ class KnmiDataUpdateCoordinator(DataUpdateCoordinator):
                 try:
                     timestamp_int = int(timestamp)
                     self._timestamp = timestamp_int
-                    self.last_update_time = datetime.fromtimestamp(timestamp_int)
+                    self.last_update_time = dt_util.utc_from_timestamp(timestamp_int)
+                    self.last_update_str = dt_util.as_local(self.last_update_time).strftime(
+                        "%d-%m-%Y %H:%M:%S"
+                    )
+                    self._last_update_monotonic = time.monotonic()
                     _LOGGER.debug("_update_timestamp to %s", self.last_update_time)
                 except ValueError:
                     _LOGGER.warning("Invalid timestamp format: %s", timestamp)
-                    self.last_update_time = datetime.now()  # Set a fallback value
+                    self.last_update_time = dt_util.utcnow()  # Set a fallback value
+                    self.last_update_str = None
+                    self._last_update_monotonic = time.monotonic()
                     self._timestamp = None
-
-    def _schedule_next_update(self) -> None:
-        """Schedule the next update based on last_update_time + timedelta(minutes=11)."""
-        if self.last_update_time is not None:
-            next_update_time = self.last_update_time + timedelta(seconds=self.refresh_interval)
-            _LOGGER.debug("self.refresh_interval: %s", self.refresh_interval)
-            _LOGGER.debug("next_update_time exists")
-            _LOGGER.debug("next_update_time: %s", next_update_time)
-
-            now = datetime.now()
-
-            if next_update_time > now:
-                random_time = random.randint(1, 60)
-                delay = (next_update_time - now).total_seconds() + random_time
-
-                async def refresh():
-                    await asyncio.sleep(delay)
-                    await self.async_request_refresh()
-
-                asyncio.create_task(refresh())
-
-    def notification_exists(self) -> bool:
-        """Check if the notification with notification_id exists."""
-        return self.api.notification_exists()
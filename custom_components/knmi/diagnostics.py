@@ -2,6 +2,7 @@
 # diagnostics.py
 
 import asyncio
+from datetime import datetime
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, CONF_LATITUDE, CONF_LONGITUDE
@@ -17,6 +18,8 @@ class KnmiDiagnostics:
         """Initialize KNMI Diagnostics support."""
         self.hass = hass
         self.coordinator_cache = self.hass.data[DOMAIN]
+        # Redacted config entries by entry_id, with the modified_at they were built from
+        self._redacted_cache: dict[str, tuple[datetime, dict]] = {}
 
     async def get_config_entry_diagnostics(
         self, config_entry: ConfigEntry
@@ -29,30 +32,37 @@ class KnmiDiagnostics:
         Returns:
             dict: A dictionary containing the diagnostics information.
         """
-        self._validate_config_entry(config_entry)
+        assert isinstance(config_entry, ConfigEntry)
         coordinator = self._get_coordinator(config_entry)
         data = await self._get_coordinator_data(coordinator)
 
-        redacted_config_entry = {
-            k: v for k, v in config_entry.as_dict().items() if k not in TO_REDACT
-        }
-
         return {
-            "config_entry": redacted_config_entry,
+            "config_entry": self._get_redacted_config_entry(config_entry),
             "data": data,
         }
 
-    def _validate_config_entry(self, config_entry: ConfigEntry) -> None:
-        """Validate if the input is a valid ConfigEntry instance.
+    def _get_redacted_config_entry(self, config_entry: ConfigEntry) -> dict:
+        """Return the config entry without the redacted keys, cached per entry version.
 
         Args:
-            config_entry (ConfigEntry): The config entry to validate.
+            config_entry (ConfigEntry): The config entry to redact.
 
-        Raises:
-            TypeError: If config_entry is not a ConfigEntry instance.
+        Returns:
+            dict: The config entry as a dictionary, without the TO_REDACT keys.
         """
-        if not isinstance(config_entry, ConfigEntry):
-            raise TypeError("config_entry should be a ConfigEntry instance")
+        # Every update of an entry bumps modified_at, older Home Assistant
+        # versions don't have it and always rebuild
+        modified_at = getattr(config_entry, "modified_at", None)
+        cached = self._redacted_cache.get(config_entry.entry_id)
+        if modified_at is not None and cached is not None and cached[0] == modified_at:
+            return cached[1]
+
+        redacted_config_entry = {
+            k: v for k, v in config_entry.as_dict().items() if k not in TO_REDACT
+        }
+        if modified_at is not None:
+            self._redacted_cache[config_entry.entry_id] = (modified_at, redacted_config_entry)
+        return redacted_config_entry
 
     def _get_coordinator(self, config_entry: ConfigEntry) -> KnmiDataUpdateCoordinator:
         """Retrieve the coordinator for the given config entry.
@@ -90,11 +100,14 @@ class KnmiDiagnostics:
 
     async def refresh_all_data(self) -> None:
         """Refresh KNMI data for all config entries."""
-        await asyncio.gather(
-            *[self.refresh_data(config_entry) for config_entry in self.hass.config_entries.async_entries(DOMAIN)]
-        )
+        async with asyncio.TaskGroup() as task_group:
+            for config_entry in self.hass.config_entries.async_entries(DOMAIN):
+                task_group.create_task(self.refresh_data(config_entry))
 
     async def async_on_remove(self) -> None:
         """Remove config entries when the integration is uninstalled."""
-        async for config_entry in self.hass.config_entries.async_entries(DOMAIN):
-            await self.hass.config_entries.async_remove(config_entry.entry_id)
\ No newline at end of file
+        async with asyncio.TaskGroup() as task_group:
+            for config_entry in self.hass.config_entries.async_entries(DOMAIN):
+                task_group.create_task(
+                    self.hass.config_entries.async_remove(config_entry.entry_id)
+                )
\ No newline at end of file
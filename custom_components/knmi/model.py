@@ -1,11 +1,10 @@
 # model.py
 
-from dataclasses import dataclass
 from datetime import datetime
+from typing import NamedTuple
 
 
-@dataclass
-class WeatherData:
+class WeatherData(NamedTuple):
     """Class representing weather data."""
 
     # Properties with type hints
@@ -2,14 +2,18 @@
 # sensor.py
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.const import CONF_NAME
 
-from .const import DOMAIN, SENSORS, WIND_DIRECTIONS_ICON_MAP
+from .const import DOMAIN, SENSORS, KnmiSensorDescription, icon_for_bearing
 from .entity import KnmiEntity
 
+# Turns a lower cased entity name into the slug used in unique ids
+_SLUG_TABLE = str.maketrans(" ", "_")
+
 
 class KnmiSensor(KnmiEntity, SensorEntity):
     """Knmi Sensor class."""
@@ -18,31 +22,33 @@ class KnmiSensor(KnmiEntity, SensorEntity):
         self,
         coordinator,
         config_entry,
-        name: str,
-        unit_of_measurement: str,
-        icon: str,
-        device_class: str,
-        attributes: list[dict[str, Any]],
-        data_key: str,
+        description: KnmiSensorDescription,
     ) -> None:
         super().__init__(coordinator, config_entry)
         self.entry_name = config_entry.data.get(CONF_NAME)
-        self._name = name
-        self._unit_of_measurement = unit_of_measurement
-        self._icon = icon
-        self._device_class = device_class
-        self._attributes = attributes
-        self._data_key = data_key
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor."""
-        return f"{self.entry_name} {self._name}"
+        self._name = description.name
+        self._attr_name = f"{self.entry_name} {self._name}"
+        self._attr_unique_id = (
+            f"{config_entry.entry_id}-{self._attr_name.lower().translate(_SLUG_TABLE)}"
+        )
+        self._unit_of_measurement = description.native_unit_of_measurement
+        self._icon = description.icon
+        self._device_class = description.device_class
+        # (name, is data key, key or fixed value) for each extra state attribute
+        self._attribute_spec = tuple(
+            (attribute.get("name"), False, attribute["value"])
+            if "value" in attribute
+            else (attribute.get("name"), "key" in attribute, attribute.get("key"))
+            for attribute in description.attributes
+        )
+        self._data_key = description.key
+        # (coordinator data, icon) of the last icon computed
+        self._icon_cache: tuple[dict | None, str] | None = None
 
     @property
     def native_value(self) -> Any:
         """Return the native_value of the sensor."""
-        return super().get_data(self._data_key)
+        return self.get_data(self._data_key)
 
     @property
     def native_unit_of_measurement(self) -> Optional[str]:
@@ -51,16 +57,29 @@ class KnmiSensor(KnmiEntity, SensorEntity):
 
     @property
     def icon(self) -> str:
-        if self._data_key in ["windrgr", "windr"]:
-            windrgr_value = super().get_data("windrgr") # use windrgr value for both windrgr and windr
+        """Return the icon, computed once per coordinator update."""
+        data = self.coordinator.data
+        icon_cache = self._icon_cache
+        if icon_cache is not None and icon_cache[0] is data:
+            return icon_cache[1]
+        icon = self._compute_icon()
+        self._icon_cache = (data, icon)
+        return icon
+
+    def _compute_icon(self) -> str:
+        """Return the icon for the current data."""
+        data_key = self._data_key
+        get = self.get_data
+        if data_key in ("windrgr", "windr"):
+            windrgr_value = get("windrgr") # use windrgr value for both windrgr and windr
             if windrgr_value is not None:
                 return wind_direction_icon(int(windrgr_value)) # convert string windrgr_value to int
-        elif self._data_key == "temp":
-            temp_value = super().get_data("temp")
+        elif data_key == "temp":
+            temp_value = get("temp")
             if temp_value is not None:
                 return temperature_icon(float(temp_value))
-        elif self._data_key == "d0neerslag":
-            neerslag_value = super().get_data("d0neerslag")
+        elif data_key == "d0neerslag":
+            neerslag_value = get("d0neerslag")
             if neerslag_value is not None:
                 return neerslag_icon(int(neerslag_value))
 
@@ -75,13 +94,9 @@ class KnmiSensor(KnmiEntity, SensorEntity):
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the device state attributes."""
         attributes = super().extra_state_attributes
-        for attribute in self._attributes:
-            value = None
-            if "key" in attribute:
-                value = super().get_data(attribute.get("key", None))
-            if "value" in attribute:
-                value = attribute.get("value", None)
-            attributes[attribute.get("name", None)] = value
+        get = self.get_data
+        for name, is_key, payload in self._attribute_spec:
+            attributes[name] = get(payload) if is_key else payload
 
         return attributes
 
@@ -108,23 +123,13 @@ def format_timestamp(timestamp: int) -> str:
 async def async_setup_entry(hass, entry, async_add_devices):
     """Setup sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    sensors = []
-
-    for sensor in SENSORS:
-        sensors.append(
-            KnmiSensor(
-                coordinator,
-                entry,
-                sensor.get("name", None),
-                sensor.get("unit_of_measurement", None),
-                sensor.get("icon", None),
-                sensor.get("device_class", None),
-                sensor.get("attributes", []),
-                sensor.get("key", None),
-            )
-        )
+    async_add_devices(
+        [KnmiSensor(coordinator, entry, description) for description in SENSORS]
+    )
 
-    async_add_devices(sensors)
+
+# Full "mdi:" icon name for every whole degree
+_WIND_ICON_TABLE: tuple[str, ...] = tuple(f"mdi:{icon_for_bearing(d)}" for d in range(360))
 
 
 def wind_direction_icon(wind_direction_degrees: int) -> str:
@@ -137,24 +142,10 @@ def wind_direction_icon(wind_direction_degrees: int) -> str:
     Returns:
         str: The icon name in the format 'mdi:icon-name'.
     """
-    # Calculate the wind direction value in degrees (0 to 360)
-    direction = wind_direction_degrees % 360
-
-    # Find the closest wind direction value in the dictionary
-    closest_direction = min(WIND_DIRECTIONS_ICON_MAP, key=lambda angle: abs(direction - angle))
-
-    # Handle cases where the direction does not exactly match any predefined angle
-    if abs(direction - closest_direction) > 22.5:
-        # Round the direction to the nearest 45-degree angle
-        closest_direction = round(direction / 45) * 45
-
-    # Get the icon name from the directions dictionary, using the closest wind direction value
-    icon_direction = WIND_DIRECTIONS_ICON_MAP.get(closest_direction, 'compass-outline')
-
-    # Return the icon name in the format 'mdi:icon-name'
-    return f"mdi:{icon_direction}"
+    return _WIND_ICON_TABLE[wind_direction_degrees % 360]
 
 
+@lru_cache(maxsize=512)
 def temperature_icon(temperature: float) -> str:
     """
     Generate the icon name based on the temperature value.
@@ -181,6 +172,7 @@ def temperature_icon(temperature: float) -> str:
     return temp_icon
 
 
+@lru_cache(maxsize=128)
 def neerslag_icon(neerslag: int) -> str:
     """
     Generate the icon name based on the temperature value.
@@ -1,12 +1,11 @@
 """Weather platform for knmi."""
 # weather.py
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from operator import itemgetter
 from typing import Any
+from zoneinfo import ZoneInfo
 
-import pytz
-import requests
-from homeassistant.components.sensor import SensorEntity
 from homeassistant.components.weather import (
     ATTR_FORECAST_CONDITION, ATTR_FORECAST_PRECIPITATION_PROBABILITY,
     ATTR_FORECAST_TEMP, ATTR_FORECAST_TEMP_LOW, ATTR_FORECAST_TIME,
@@ -19,22 +18,107 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (CONF_NAME, PERCENTAGE, UnitOfLength,
                                  UnitOfPressure, UnitOfSpeed,
                                  UnitOfTemperature)
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.util import dt
 
-from .api import KnmiApiClient
-from .const import _LOGGER, API_TIMEZONE, ATTRIBUTION, CONDITIONS_MAP, DOMAIN
+from .const import (_LOGGER, API_TIMEZONE, ATTRIBUTION, DOMAIN, bft_from_kmh,
+                    condition_to_ha, wind_dir_to_deg)
 from .coordinator import KnmiDataUpdateCoordinator
-from .entity import KnmiEntity
 from .exceptions import KnmiApiException
 
+_TZ = ZoneInfo(API_TIMEZONE)
+
+# Data keys of each forecast day: (condition, wind direction, wind bearing,
+# min temperature, max temperature, precipitation, wind speed, sun chance, wind force)
+_FORECAST_KEYS: tuple[tuple[str, ...], ...] = tuple(
+    (
+        f"d{i}weer",
+        f"d{i}windr",
+        f"d{i}windrgr",
+        f"d{i}tmin",
+        f"d{i}tmax",
+        f"d{i}neerslag",
+        f"d{i}windkmh",
+        f"d{i}zon",
+        f"d{i}windk",
+    )
+    for i in range(3)
+)
+
+# (key, type) of the plain values of each forecast day, for coordinator.get_values
+_FORECAST_VALUE_SPECS: tuple[tuple[tuple[str, type], ...], ...] = tuple(
+    (
+        (temp_min_key, int),
+        (temp_max_key, int),
+        (precipitation_key, int),
+        (wind_speed_key, float),
+        (sun_chance_key, int),
+        (wind_force_key, int),
+    )
+    for (_, _, _, temp_min_key, temp_max_key, precipitation_key, wind_speed_key,
+         sun_chance_key, wind_force_key) in _FORECAST_KEYS
+)
+
+# (offset from today, condition key, wind direction key, wind bearing key,
+# value spec) of each forecast day, everything _build_forecast needs per day
+_FORECAST_DAYS: tuple[tuple[timedelta, str, str, str, tuple[tuple[str, type], ...]], ...] = tuple(
+    (timedelta(days=i), keys[0], keys[1], keys[2], spec)
+    for i, (keys, spec) in enumerate(zip(_FORECAST_KEYS, _FORECAST_VALUE_SPECS))
+)
+
+# Fields of a forecast entry of the API, in the order parse_forecast_data unpacks them
+_FORECAST_ENTRY_FIELDS = itemgetter(
+    "date",
+    "condition",
+    "temp_min",
+    "temp_max",
+    "precipitation_probability",
+    "wind_bearing",
+    "wind_speed",
+    "sun_chance",
+    "wind_speed_bft",
+)
+
+
+# (key, type) of the current values served by the weather properties
+_CURRENT_VALUE_SPEC: tuple[tuple[str, type], ...] = (
+    ("temp", float),
+    ("luchtd", float),
+    ("lv", int),
+    ("windkmh", float),
+    ("zicht", int),
+)
+
+
+def _parse_iso_date(value: str) -> date:
+    """Parse a YYYY-MM-DD date string."""
+    return date(int(value[0:4]), int(value[5:7]), int(value[8:10]))
+
+
+# Units used by the weather descriptions below
+_C = UnitOfTemperature.CELSIUS
+_KMH = UnitOfSpeed.KILOMETERS_PER_HOUR
+_PCT = PERCENTAGE
+_HPA = UnitOfPressure.HPA
+_KM = UnitOfLength.KILOMETERS
+
+# (key suffix, name, unit) of the descriptions repeated for each forecast day
+_DAY_DESCRIPTION_FIELDS: tuple[tuple[str, str, str | None], ...] = (
+    ("windr", "Wind Direction", None),
+    ("windkmh", "Wind Speed", _KMH),
+    ("tmax", "Max Temperature", _C),
+    ("tmin", "Min Temperature", _C),
+    ("neerslag", "Precipitation", _PCT),
+    ("zon", "Sun Chance", _PCT),
+)
+
 # Define the WeatherEntityDescription for the weather entity
-WEATHER_DESCRIPTION = [
+WEATHER_DESCRIPTION: tuple[WeatherEntityDescription, ...] = (
     WeatherEntityDescription(
         key="temp",
         name="Temperature",
-        unit_of_measurement=UnitOfTemperature.CELSIUS,
+        unit_of_measurement=_C,
     ),
     WeatherEntityDescription(
         key="d0weer",
@@ -43,17 +127,17 @@ WEATHER_DESCRIPTION = [
     WeatherEntityDescription(
         key="luchtd",
         name="Pressure",
-        unit_of_measurement=UnitOfPressure.HPA,
+        unit_of_measurement=_HPA,
     ),
     WeatherEntityDescription(
         key="lv",
         name="Humidity",
-        unit_of_measurement=PERCENTAGE,
+        unit_of_measurement=_PCT,
     ),
     WeatherEntityDescription(
         key="windkmh",
         name="Wind Speed",
-        unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
+        unit_of_measurement=_KMH,
     ),
     WeatherEntityDescription(
         key="windr",
@@ -62,99 +146,21 @@ WEATHER_DESCRIPTION = [
     WeatherEntityDescription(
         key="zicht",
         name="Visibility",
-        unit_of_measurement=UnitOfLength.KILOMETERS,
-    ),
-    WeatherEntityDescription(
-        key="d0windr",
-        name="Today's Wind Direction",
-    ),
-    WeatherEntityDescription(
-        key="d0windkmh",
-        name="Today's Wind Speed",
-        unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-    ),
-    WeatherEntityDescription(
-        key="d0tmax",
-        name="Today's Max Temperature",
-        unit_of_measurement=UnitOfTemperature.CELSIUS,
-    ),
-    WeatherEntityDescription(
-        key="d0tmin",
-        name="Today's Min Temperature",
-        unit_of_measurement=UnitOfTemperature.CELSIUS,
-    ),
-    WeatherEntityDescription(
-        key="d0neerslag",
-        name="Today's Precipitation",
-        unit_of_measurement=PERCENTAGE,
-    ),
-    WeatherEntityDescription(
-        key="d0zon",
-        name="Today's Sun Chance",
-        unit_of_measurement=PERCENTAGE,
-    ),
-    WeatherEntityDescription(
-        key="d1windr",
-        name="Tomorrow's Wind Direction",
-    ),
-    WeatherEntityDescription(
-        key="d1windkmh",
-        name="Tomorrow's Wind Speed",
-        unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-    ),
-    WeatherEntityDescription(
-        key="d1tmax",
-        name="Tomorrow's Max Temperature",
-        unit_of_measurement=UnitOfTemperature.CELSIUS,
-    ),
-    WeatherEntityDescription(
-        key="d1tmin",
-        name="Tomorrow's Min Temperature",
-        unit_of_measurement=UnitOfTemperature.CELSIUS,
-    ),
-    WeatherEntityDescription(
-        key="d1neerslag",
-        name="Tomorrow's Precipitation",
-        unit_of_measurement=PERCENTAGE,
-    ),
-    WeatherEntityDescription(
-        key="d1zon",
-        name="Tomorrow's Sun Chance",
-        unit_of_measurement=PERCENTAGE,
-    ),
-    WeatherEntityDescription(
-        key="d2windr",
-        name="Day After Tomorrow's Wind Direction",
-    ),
-    WeatherEntityDescription(
-        key="d2windkmh",
-        name="Day After Tomorrow's Wind Speed",
-        unit_of_measurement=UnitOfSpeed.KILOMETERS_PER_HOUR,
-    ),
-    WeatherEntityDescription(
-        key="d2tmax",
-        name="Day After Tomorrow's Max Temperature",
-        unit_of_measurement=UnitOfTemperature.CELSIUS,
+        unit_of_measurement=_KM,
     ),
-    WeatherEntityDescription(
-        key="d2tmin",
-        name="Day After Tomorrow's Min Temperature",
-        unit_of_measurement=UnitOfTemperature.CELSIUS,
-    ),
-    WeatherEntityDescription(
-        key="d2neerslag",
-        name="Day After Tomorrow's Precipitation",
-        unit_of_measurement=PERCENTAGE,
-    ),
-    WeatherEntityDescription(
-        key="d2zon",
-        name="Day After Tomorrow's Sun Chance",
-        unit_of_measurement=PERCENTAGE,
+    *(
+        WeatherEntityDescription(
+            key=f"d{day}{suffix}",
+            name=f"{prefix} {name}",
+            unit_of_measurement=unit,
+        )
+        for day, prefix in enumerate(("Today's", "Tomorrow's", "Day After Tomorrow's"))
+        for suffix, name, unit in _DAY_DESCRIPTION_FIELDS
     ),
-]
+)
 
 
-class KnmiWeather(WeatherEntity, SensorEntity):
+class KnmiWeather(WeatherEntity):
     """Defines a KNMI weather entity."""
 
     _attr_attribution = ATTRIBUTION
@@ -179,7 +185,41 @@ class KnmiWeather(WeatherEntity, SensorEntity):
         self._attr_unique_id = f"{entry_id}-{conf_name}"
         self._attr_device_info = coordinator.device_info
         self._attr_supported_features = WeatherEntityFeature.FORECAST_DAILY
-        self._attr_condition = self.map_condition("image")
+        # (coordinator data, value) of the last condition computed
+        self._condition_cache: tuple[dict | None, str | None] | None = None
+        # Forecast of the last build, rebuilt once the coordinator has new data
+        self._forecast_dirty = True
+        self._forecast_cached: list[Forecast] = []
+        # (local date, start of that day in UTC) of the last forecast built
+        self._today_cache: tuple[date | None, datetime | None] = (None, None)
+        # Current values, converted by _snapshot_values once the entity is added
+        self._native_temperature: float | None = None
+        self._native_pressure: float | None = None
+        self._humidity: int | None = None
+        self._native_wind_speed: float | None = None
+        self._native_visibility: int | None = None
+        self._wind_bearing: float | None = None
+        self._attr_condition = self.condition
+
+    async def async_added_to_hass(self) -> None:
+        """Refresh the current values whenever the coordinator has new data."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self.coordinator.async_add_listener(self._snapshot_values))
+        # The first refresh may have finished before the listener was added
+        self._snapshot_values()
+
+    @callback
+    def _snapshot_values(self) -> None:
+        """Convert the current values of the coordinator data once per update."""
+        self._forecast_dirty = True
+        (
+            self._native_temperature,
+            self._native_pressure,
+            self._humidity,
+            self._native_wind_speed,
+            self._native_visibility,
+        ) = self.coordinator.get_values(_CURRENT_VALUE_SPEC)
+        self._wind_bearing = self.get_wind_bearing("windr", "windrgr")
 
     @property
     def name(self) -> str:
@@ -189,18 +229,18 @@ class KnmiWeather(WeatherEntity, SensorEntity):
     def map_condition(self, key: str | None) -> str | None:
         """Map weather conditions from KNMI to HA."""
         value = self.coordinator.get_value(key, str)
-        if value == "":
+        if not value:
+            # Empty or missing, get_value already warned about the latter
             return None
 
-        try:
-            return CONDITIONS_MAP[value]
-        except KeyError:
+        condition = condition_to_ha(value)
+        if condition is None:
             _LOGGER.error(
                 "Weather condition %s (for %s) is unknown, please raise a bug",
                 value,
                 key,
             )
-        return None
+        return condition
 
     def get_wind_bearing(
         self, wind_dir_key: str, wind_dir_degree_key: str
@@ -213,64 +253,104 @@ class KnmiWeather(WeatherEntity, SensorEntity):
                 wind_dir_key,
             )
             return None
-        return self.coordinator.get_value(wind_dir_degree_key, int)
+        wind_bearing = self.coordinator.get_value(wind_dir_degree_key, int)
+        if wind_bearing is None and wind_dir is not None:
+            # Fall back to the bearing of the wind direction name
+            return wind_dir_to_deg(wind_dir)
+        return wind_bearing
 
     @property
     def condition(self) -> str | None:
         """Return the current condition."""
-        return self.map_condition("image")
+        data = self.coordinator.data
+        cached = self._condition_cache
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        condition = self.map_condition("image")
+        self._condition_cache = (data, condition)
+        return condition
 
     @property
     def native_temperature(self) -> float | None:
         """Return the temperature in native units."""
-        return self.coordinator.get_value("temp", float)
+        return self._native_temperature
 
     @property
     def native_pressure(self) -> float | None:
         """Return the pressure in native units."""
-        return self.coordinator.get_value("luchtd", float)
+        return self._native_pressure
 
     @property
     def humidity(self) -> int | None:
         """Return the humidity in native units."""
-        return self.coordinator.get_value("lv", int)
+        return self._humidity
 
     @property
     def native_wind_speed(self) -> float | None:
         """Return the wind speed in native units."""
-        return self.coordinator.get_value("windkmh", float)
+        return self._native_wind_speed
 
     @property
     def wind_bearing(self) -> float | str | None:
         """Return the wind bearing."""
-        return self.get_wind_bearing("windr", "windrgr")
+        return self._wind_bearing
 
     @property
     def native_visibility(self) -> int | None:
         """Return the visibility in native units."""
-        return self.coordinator.get_value("zicht", int)
+        return self._native_visibility
 
     @property
     def forecast(self) -> list[Forecast] | None:
         """Return the forecast in native units."""
+        # A new local day shifts the forecast dates, also without new data
+        self._today_utc()
+        if not self._forecast_dirty:
+            return self._forecast_cached
+        self._forecast_cached = self._build_forecast()
+        self._forecast_dirty = False
+        return self._forecast_cached
+
+    def _today_utc(self) -> datetime:
+        """Return the start of the current local day in UTC, recomputed at midnight.
+
+        A new day marks the forecast dirty.
+        """
+        now = dt.now(_TZ)
+        local_date = now.date()
+        cached_date, today = self._today_cache
+        if cached_date != local_date:
+            today = dt.as_utc(now.replace(hour=0, minute=0, second=0, microsecond=0))
+            self._today_cache = (local_date, today)
+            self._forecast_dirty = True
+        return today
+
+    def _build_forecast(self) -> list[Forecast]:
+        """Build the forecast for today and the next two days from the data.
+
+        Runs once per coordinator update or new local day (see forecast).
+        The list and its dicts are new each time rather than updated in place:
+        the previous state's attributes still reference the old ones, and
+        mutating them would hide the change from the state machine.
+        """
         forecast = []
-        timezone = pytz.timezone(API_TIMEZONE)
-        today = dt.as_utc(
-            dt.now(timezone).replace(hour=0, minute=0, second=0, microsecond=0)
-        )
-
-        for i in range(0, 3):
-            date = today + timedelta(days=i)
-            condition = self.map_condition(f"d{i}weer")
-            wind_bearing = self.get_wind_bearing(f"d{i}windr", f"d{i}windrgr")
-            temp_min = self.coordinator.get_value(f"d{i}tmin", int)
-            temp_max = self.coordinator.get_value(f"d{i}tmax", int)
-            precipitation_probability = self.coordinator.get_value(
-                f"d{i}neerslag", int
-            )
-            wind_speed = self.coordinator.get_value(f"d{i}windkmh", float)
-            sun_chance = self.coordinator.get_value(f"d{i}zon", int)
-            wind_speed_bft = self.coordinator.get_value(f"d{i}windk", int)
+        today = self._today_utc()
+
+        get_values = self.coordinator.get_values
+        for offset, condition_key, wind_dir_key, wind_dir_degree_key, spec in _FORECAST_DAYS:
+            date = today + offset
+            condition = self.map_condition(condition_key)
+            wind_bearing = self.get_wind_bearing(wind_dir_key, wind_dir_degree_key)
+            (
+                temp_min,
+                temp_max,
+                precipitation_probability,
+                wind_speed,
+                sun_chance,
+                wind_speed_bft,
+            ) = get_values(spec)
+            if wind_speed_bft is None and wind_speed is not None:
+                wind_speed_bft = bft_from_kmh(wind_speed)
             next_day = {
                 ATTR_FORECAST_TIME: date.isoformat(),
                 ATTR_FORECAST_CONDITION: condition,
@@ -292,22 +372,15 @@ class KnmiWeather(WeatherEntity, SensorEntity):
         self._attr_wind_speed = float(api_data["windkmh"])
         self._attr_humidity = int(api_data["lv"])
         self._attr_wind_direction = api_data["windr"]
-        self._attr_condition = self.map_condition("image")
-        self.temperature = float(api_data["temp"])
-        self.wind_speed = float(api_data["windkmh"])
-        self.humidity = int(api_data["lv"])
-        self.wind_direction = api_data["windr"]
-        self.condition = self.map_condition("image")
+        self._attr_condition = self.condition
 
 
     async def async_forecast_daily(self) -> list[Forecast] | None:
         """Return the daily forecast in native units.
 
-        Only implement this method if `WeatherEntityFeature.FORECAST_DAILY` is set.
+        Only implement this method if `WeatherEntityFeature.FORECAST_DAILY` is set,
+        which it always is for this entity.
         """
-        if WeatherEntityFeature.FORECAST_DAILY not in self.supported_features:
-            return None
-
         try:
             daily_forecast_data = await self.coordinator.api.async_fetch_daily_forecast_data()
             return self.parse_forecast_data(daily_forecast_data)
@@ -316,87 +389,38 @@ class KnmiWeather(WeatherEntity, SensorEntity):
             return None
 
     def parse_forecast_data(self, forecast_data: list[dict[str, Any]]) -> list[Forecast]:
+        """Convert the forecast entries of the API to HA forecasts."""
         forecast = []
 
         for entry in forecast_data:
-            date_str = entry["date"]
-            condition = entry["condition"]
-            temp_min = entry["temp_min"]
-            temp_max = entry["temp_max"]
-            precipitation_probability = entry["precipitation_probability"]
-            wind_bearing = entry["wind_bearing"]
-            wind_speed = entry["wind_speed"]
-            sun_chance = entry["sun_chance"]
-            wind_speed_bft = entry["wind_speed_bft"]
-
-            date = datetime.strptime(date_str, "%Y-%m-%d").date()
-
-            forecast_entry = {
-                ATTR_FORECAST_TIME: date.isoformat(),
-                ATTR_FORECAST_CONDITION: condition,
-                ATTR_FORECAST_TEMP_LOW: temp_min,
-                ATTR_FORECAST_TEMP: temp_max,
-                ATTR_FORECAST_PRECIPITATION_PROBABILITY: precipitation_probability,
-                ATTR_FORECAST_WIND_BEARING: wind_bearing,
-                ATTR_FORECAST_WIND_SPEED: wind_speed,
-                # Not officially supported, but nice additions.
-                "wind_speed_bft": wind_speed_bft,
-                "sun_chance": sun_chance,
-            }
-            forecast.append(forecast_entry)
+            (
+                date_str,
+                condition,
+                temp_min,
+                temp_max,
+                precipitation_probability,
+                wind_bearing,
+                wind_speed,
+                sun_chance,
+                wind_speed_bft,
+            ) = _FORECAST_ENTRY_FIELDS(entry)
+            forecast.append(
+                {
+                    ATTR_FORECAST_TIME: _parse_iso_date(date_str).isoformat(),
+                    ATTR_FORECAST_CONDITION: condition,
+                    ATTR_FORECAST_TEMP_LOW: temp_min,
+                    ATTR_FORECAST_TEMP: temp_max,
+                    ATTR_FORECAST_PRECIPITATION_PROBABILITY: precipitation_probability,
+                    ATTR_FORECAST_WIND_BEARING: wind_bearing,
+                    ATTR_FORECAST_WIND_SPEED: wind_speed,
+                    # Not officially supported, but nice additions.
+                    "wind_speed_bft": wind_speed_bft,
+                    "sun_chance": sun_chance,
+                }
+            )
 
         return forecast
 
-async def fetch_and_process_daily_forecast(api_client: KnmiApiClient):
-    try:
-        daily_forecast_data = await api_client.async_fetch_daily_forecast_data()
-        # Process the daily_forecast_data here
-        for forecast_entry in daily_forecast_data:
-            date = forecast_entry["date"]
-            condition = forecast_entry["condition"]
-            temp_min = forecast_entry["temp_min"]
-            temp_max = forecast_entry["temp_max"]
-            precipitation_probability = forecast_entry["precipitation_probability"]
-            wind_bearing = forecast_entry["wind_bearing"]
-            wind_speed = forecast_entry["wind_speed"]
-            #print(f"Date: {date}, Condition: {condition}, Temp Min: {temp_min}, Temp Max: {temp_max}, Precipitation Probability: {precipitation_probability}, Wind Bearing: {wind_bearing}, Wind Speed: {wind_speed}")
-    except KnmiApiException as e:
-        #print(f"Error fetching daily forecast data: {e}")
-        raise Exception(f"Error fetching daily forecast data: {e}")
-
-async def fetch_daily_forecast_data(self) -> list[dict[str, Any]]:
-    try:
-        response = await self.coordinator.api.async_fetch_daily_forecast_data()
-        data = response.json()
-
-        daily_forecast_data = []
-        for entry in data["forecast"]:
-            date_str = entry["date"]
-            condition = entry["condition"]
-            temp_min = entry["temp_min"]
-            temp_max = entry["temp_max"]
-            precipitation_probability = entry["precipitation_probability"]
-            wind_bearing = entry["wind_bearing"]
-            wind_speed = entry["wind_speed"]
-
-            date = datetime.strptime(date_str, "%Y-%m-%d").date()
-
-            forecast_entry = {
-                "date": date,
-                "condition": condition,
-                "temp_min": temp_min,
-                "temp_max": temp_max,
-                "precipitation_probability": precipitation_probability,
-                "wind_bearing": wind_bearing,
-                "wind_speed": wind_speed,
-            }
-            daily_forecast_data.append(forecast_entry)
-
-        return daily_forecast_data
-
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"Error fetching daily forecast data: {e}")
-
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
     """Set up KNMI weather based on a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
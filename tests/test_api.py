@@ -1,12 +1,21 @@
 """Tests for knmi api."""
 
+import pytest
 from homeassistant.const import CONF_API_KEY, CONF_LATITUDE, CONF_LONGITUDE
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from custom_components.knmi.api import KnmiApiClient
+from custom_components.knmi.const import API_ENDPOINT
 
 from .const import MOCK_CONFIG, MOCK_JSON
 
+MOCK_URL = API_ENDPOINT.format(
+    MOCK_CONFIG[CONF_API_KEY],
+    MOCK_CONFIG[CONF_LATITUDE],
+    MOCK_CONFIG[CONF_LONGITUDE],
+)
+MOCK_HEADERS = {"Content-Type": "application/json", "ETag": '"v1"'}
+
 
 async def test_api(hass, aioclient_mock, caplog):
     """Test API calls."""
@@ -29,3 +38,42 @@ async def test_api(hass, aioclient_mock, caplog):
     )
     response = await api.async_get_data()
     assert response == MOCK_JSON["liveweer"][0]
+
+
+@pytest.fixture(name="api")
+def api_fixture(hass, aioclient_mock):
+    """Return an API client with a mocked endpoint."""
+    aioclient_mock.get(MOCK_URL, json=MOCK_JSON, headers=MOCK_HEADERS)
+    return KnmiApiClient(
+        MOCK_CONFIG[CONF_API_KEY],
+        MOCK_CONFIG[CONF_LATITUDE],
+        MOCK_CONFIG[CONF_LONGITUDE],
+        async_get_clientsession(hass),
+        hass,
+    )
+
+
+async def test_api_always_requests(api, aioclient_mock):
+    """Test that every fetch requests the API."""
+    assert await api.async_get_data() == MOCK_JSON["liveweer"][0]
+    assert await api.async_fetch_daily_forecast_data() == MOCK_JSON.get("forecast", [])
+    assert aioclient_mock.call_count == 2
+
+
+async def test_api_unchanged_payload(api, aioclient_mock):
+    """Test that an unchanged response reuses the parsed payload."""
+    first = await api.async_get_data()
+    second = await api.async_get_data()
+    assert aioclient_mock.call_count == 2
+    assert second is first
+
+
+async def test_api_not_modified(api, aioclient_mock):
+    """Test that a 304 response to a conditional request reuses the parsed payload."""
+    first = await api.async_get_data()
+
+    aioclient_mock.clear_requests()
+    aioclient_mock.get(MOCK_URL, status=304)
+    assert await api.async_get_data() is first
+    _, _, _, headers = aioclient_mock.mock_calls[-1]
+    assert headers["If-None-Match"] == MOCK_HEADERS["ETag"]
@@ -23,6 +23,8 @@ async def test_setup_unload_and_reload_entry(hass, bypass_get_data):
     """Test entry setup and unload."""
     # Create a mock entry so we don't have to go through config flow
     config_entry = MockConfigEntry(domain=DOMAIN, data=MOCK_CONFIG, entry_id="test")
+    # The entry has to be known to Home Assistant to be reloaded
+    config_entry.add_to_hass(hass)
 
     # Set up the entry and assert that the values set during setup are where we expect
     # them to be. Because we have patched the KnmiDataUpdateCoordinator.async_get_data
@@ -31,10 +33,12 @@ async def test_setup_unload_and_reload_entry(hass, bypass_get_data):
     assert DOMAIN in hass.data and config_entry.entry_id in hass.data[DOMAIN]
     assert type(hass.data[DOMAIN][config_entry.entry_id]) == KnmiDataUpdateCoordinator
 
-    # Reload the entry and assert that the data from above is still there
+    # Reload the entry and assert that it has been set up again with a new coordinator
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
     assert await async_reload_entry(hass, config_entry) is None
     assert DOMAIN in hass.data and config_entry.entry_id in hass.data[DOMAIN]
     assert type(hass.data[DOMAIN][config_entry.entry_id]) == KnmiDataUpdateCoordinator
+    assert hass.data[DOMAIN][config_entry.entry_id] is not coordinator
 
     # Unload the entry and verify that the data has been removed
     assert await async_unload_entry(hass, config_entry)